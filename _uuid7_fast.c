@@ -0,0 +1,389 @@
+/*
+ * _uuid7_fast.c
+ *
+ * Optional C implementation of the UUIDv7 composition and decomposition
+ * hot paths. It packs the timestamp, counter and random values into the
+ * 128 bits of the UUID as two `uint64_t` words and builds the resulting
+ * Python int only once, and extracts them back from the UUID fields, instead
+ * of doing several big ints operations in the interpreter.
+ *
+ * `uuid7.py` falls back to its pure Python implementation when this
+ * module is not available.
+ *
+ * Author:
+ *     Jesús Leganés-Combarro 'piranna' (https://piranna.github.io)
+ *     for TRC (https://trc.es/)
+ *
+ * Copyright:
+ *     (c) 2024 Jesús Leganés-Combarro. All rights reserved.
+ *
+ * License:
+ *     MIT
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <stdint.h>
+
+
+#define MASK62 ((UINT64_C(1) << 62) - 1)  /* `rand_b` field */
+#define VERSION_BITS (UINT64_C(0x7) << 12)  /* UUID version 7 */
+#define VARIANT_BITS (UINT64_C(0x2) << 62)  /* UUID variant (RFC 9562) */
+
+
+typedef struct {
+    uint64_t hi;
+    uint64_t lo;
+} uint128;
+
+
+static inline uint128
+shift_left(uint128 value, unsigned int num_bits)
+{
+    uint128 result;
+
+    if (num_bits == 0) {
+        result = value;
+    } else if (num_bits < 64) {
+        result.hi = value.hi << num_bits | value.lo >> (64 - num_bits);
+        result.lo = value.lo << num_bits;
+    } else {
+        result.hi = value.lo << (num_bits - 64);
+        result.lo = 0;
+    }
+
+    return result;
+}
+
+
+static inline uint128
+shift_right(uint128 value, unsigned int num_bits)
+{
+    uint128 result;
+
+    if (num_bits == 0) {
+        result = value;
+    } else if (num_bits < 64) {
+        result.hi = value.hi >> num_bits;
+        result.lo = value.lo >> num_bits | value.hi << (64 - num_bits);
+    } else {
+        result.hi = 0;
+        result.lo = value.hi >> (num_bits - 64);
+    }
+
+    return result;
+}
+
+
+/* Keep only the lowest `num_bits` bits */
+static inline uint128
+mask_low(uint128 value, unsigned int num_bits)
+{
+    if (num_bits < 64) {
+        value.hi = 0;
+        value.lo &= (UINT64_C(1) << num_bits) - 1;
+    } else if (num_bits < 128) {
+        value.hi &= (UINT64_C(1) << (num_bits - 64)) - 1;
+    }
+
+    return value;
+}
+
+
+static inline uint64_t
+load_be64(const unsigned char *buffer)
+{
+    uint64_t result = 0;
+
+    for (int i = 0; i < 8; i++) {
+        result = result << 8 | buffer[i];
+    }
+
+    return result;
+}
+
+
+static inline void
+store_be64(unsigned char *buffer, uint64_t value)
+{
+    for (int i = 7; i >= 0; i--) {
+        buffer[i] = (unsigned char)value;
+        value >>= 8;
+    }
+}
+
+
+/* Convert a non-negative Python int of up to 128 bits */
+static int
+as_uint128(PyObject *obj, uint128 *result)
+{
+    unsigned char buffer[16];
+
+    if (!PyLong_Check(obj)) {
+        PyErr_SetString(PyExc_TypeError, "an integer is required");
+        return -1;
+    }
+
+#if PY_VERSION_HEX >= 0x030D0000
+    Py_ssize_t size = PyLong_AsNativeBytes(
+        obj, buffer, sizeof(buffer),
+        Py_ASNATIVEBYTES_BIG_ENDIAN | Py_ASNATIVEBYTES_UNSIGNED_BUFFER |
+        Py_ASNATIVEBYTES_REJECT_NEGATIVE
+    );
+
+    if (size < 0) {
+        return -1;
+    }
+    if (size > (Py_ssize_t)sizeof(buffer)) {
+        PyErr_SetString(PyExc_OverflowError, "int too big to convert");
+        return -1;
+    }
+#else
+    if (_PyLong_AsByteArray(
+        (PyLongObject *)obj, buffer, sizeof(buffer), 0, 0
+    ) < 0) {
+        return -1;
+    }
+#endif
+
+    result->hi = load_be64(buffer);
+    result->lo = load_be64(buffer + 8);
+
+    return 0;
+}
+
+
+static PyObject *
+from_uint128(uint128 value)
+{
+    unsigned char buffer[16];
+
+    store_be64(buffer, value.hi);
+    store_be64(buffer + 8, value.lo);
+
+#if PY_VERSION_HEX >= 0x030D0000
+    return PyLong_FromUnsignedNativeBytes(
+        buffer, sizeof(buffer), Py_ASNATIVEBYTES_BIG_ENDIAN
+    );
+#else
+    return _PyLong_FromByteArray(buffer, sizeof(buffer), 0, 0);
+#endif
+}
+
+
+PyDoc_STRVAR(compose_doc,
+"compose(unix_ts_ms_with_fraction, unix_ts_ms_fraction_num_bits, counter,\n"
+"        random_num_bits, random)\n"
+"--\n"
+"\n"
+"Compose the UUIDv7 int with the timestamp, counters and random data");
+
+static PyObject *
+compose(
+    PyObject *Py_UNUSED(module), PyObject *const *args, Py_ssize_t nargs
+)
+{
+    uint128 unix_ts_ms_with_fraction, counter, random;
+    long unix_ts_ms_fraction_num_bits, random_num_bits;
+
+    if (nargs != 5) {
+        PyErr_Format(
+            PyExc_TypeError, "compose() takes exactly 5 arguments (%zd given)",
+            nargs
+        );
+        return NULL;
+    }
+
+    if (as_uint128(args[0], &unix_ts_ms_with_fraction) < 0) {
+        return NULL;
+    }
+
+    unix_ts_ms_fraction_num_bits = PyLong_AsLong(args[1]);
+    if (unix_ts_ms_fraction_num_bits == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+
+    if (as_uint128(args[2], &counter) < 0) {
+        return NULL;
+    }
+
+    random_num_bits = PyLong_AsLong(args[3]);
+    if (random_num_bits == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+
+    if (as_uint128(args[4], &random) < 0) {
+        return NULL;
+    }
+
+    if (
+        unix_ts_ms_fraction_num_bits < 0 || unix_ts_ms_fraction_num_bits > 12
+    ) {
+        PyErr_SetString(
+            PyExc_ValueError,
+            "Invalid number of bits for the timestamp fraction"
+        );
+        return NULL;
+    }
+    if (random_num_bits < 0 || random_num_bits > 74) {
+        PyErr_SetString(
+            PyExc_ValueError, "Invalid number of bits for the random"
+        );
+        return NULL;
+    }
+
+    /* 74 bits data with the timestamp, counters and random data */
+    unix_ts_ms_with_fraction = shift_left(
+        unix_ts_ms_with_fraction,
+        (unsigned int)(74 - unix_ts_ms_fraction_num_bits)
+    );
+    counter = shift_left(counter, (unsigned int)random_num_bits);
+
+    uint128 data = {
+        unix_ts_ms_with_fraction.hi | counter.hi | random.hi,
+        unix_ts_ms_with_fraction.lo | counter.lo | random.lo
+    };
+
+    /* Split the data into the `unix_ts_ms`, `rand_a` and `rand_b` fields
+       and stamp the version and variant bits */
+    uint64_t unix_ts_ms_and_rand_a = data.hi << 2 | data.lo >> 62;
+
+    uint128 result = {
+        (unix_ts_ms_and_rand_a >> 12) << 16 |
+        VERSION_BITS |
+        (unix_ts_ms_and_rand_a & 0x0fff),
+
+        VARIANT_BITS | (data.lo & MASK62)
+    };
+
+    return from_uint128(result);
+}
+
+
+PyDoc_STRVAR(decompose_doc,
+"decompose(unix_ts_ms, rand_a, rand_b, unix_ts_ms_fraction_num_bits,\n"
+"          counter_num_bits)\n"
+"--\n"
+"\n"
+"Decompose the fields into the timestamp, counters and random data");
+
+static PyObject *
+decompose(
+    PyObject *Py_UNUSED(module), PyObject *const *args, Py_ssize_t nargs
+)
+{
+    uint64_t unix_ts_ms, rand_a, rand_b;
+    long unix_ts_ms_fraction_num_bits, counter_num_bits;
+
+    if (nargs != 5) {
+        PyErr_Format(
+            PyExc_TypeError,
+            "decompose() takes exactly 5 arguments (%zd given)", nargs
+        );
+        return NULL;
+    }
+
+    unix_ts_ms = PyLong_AsUnsignedLongLong(args[0]);
+    if (unix_ts_ms == (uint64_t)-1 && PyErr_Occurred()) {
+        return NULL;
+    }
+
+    rand_a = PyLong_AsUnsignedLongLong(args[1]);
+    if (rand_a == (uint64_t)-1 && PyErr_Occurred()) {
+        return NULL;
+    }
+
+    rand_b = PyLong_AsUnsignedLongLong(args[2]);
+    if (rand_b == (uint64_t)-1 && PyErr_Occurred()) {
+        return NULL;
+    }
+
+    unix_ts_ms_fraction_num_bits = PyLong_AsLong(args[3]);
+    if (unix_ts_ms_fraction_num_bits == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+
+    counter_num_bits = PyLong_AsLong(args[4]);
+    if (counter_num_bits == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+
+    if (unix_ts_ms >> 48 || rand_a >> 12 || rand_b >> 62) {
+        PyErr_SetString(PyExc_ValueError, "Field out of range");
+        return NULL;
+    }
+    if (
+        unix_ts_ms_fraction_num_bits < 0 || unix_ts_ms_fraction_num_bits > 12
+    ) {
+        PyErr_SetString(
+            PyExc_ValueError,
+            "Invalid number of bits for the timestamp fraction"
+        );
+        return NULL;
+    }
+    if (
+        counter_num_bits < 0 ||
+        counter_num_bits > 74 - unix_ts_ms_fraction_num_bits
+    ) {
+        PyErr_SetString(
+            PyExc_ValueError, "Invalid number of bits for the counter"
+        );
+        return NULL;
+    }
+
+    unsigned int random_num_bits = (unsigned int)(
+        74 - unix_ts_ms_fraction_num_bits - counter_num_bits
+    );
+
+    /* 74 bits data with the timestamp, counters and random data */
+    uint128 data = {
+        unix_ts_ms << 10 | rand_a >> 2,
+        rand_a << 62 | rand_b
+    };
+
+    PyObject *unix_ts_ms_with_fraction = from_uint128(
+        shift_right(data, (unsigned int)(74 - unix_ts_ms_fraction_num_bits))
+    );
+    PyObject *counter = from_uint128(mask_low(
+        shift_right(data, random_num_bits), (unsigned int)counter_num_bits
+    ));
+    PyObject *random = from_uint128(mask_low(data, random_num_bits));
+
+    PyObject *result = NULL;
+
+    if (unix_ts_ms_with_fraction && counter && random) {
+        result = PyTuple_Pack(3, unix_ts_ms_with_fraction, counter, random);
+    }
+
+    Py_XDECREF(unix_ts_ms_with_fraction);
+    Py_XDECREF(counter);
+    Py_XDECREF(random);
+
+    return result;
+}
+
+
+static PyMethodDef methods[] = {
+    {"compose", (PyCFunction)(void (*)(void))compose, METH_FASTCALL,
+     compose_doc},
+    {"decompose", (PyCFunction)(void (*)(void))decompose, METH_FASTCALL,
+     decompose_doc},
+    {NULL, NULL, 0, NULL}
+};
+
+
+static struct PyModuleDef module = {
+    PyModuleDef_HEAD_INIT,
+    .m_name = "_uuid7_fast",
+    .m_doc = "Optional C implementation of the UUIDv7 hot paths",
+    .m_size = 0,
+    .m_methods = methods,
+};
+
+
+PyMODINIT_FUNC
+PyInit__uuid7_fast(void)
+{
+    return PyModule_Create(&module);
+}
@@ -0,0 +1,35 @@
+"""
+build.py
+
+Poetry build script for the optional `_uuid7_fast` C extension. If it can't
+be compiled, the package is built anyway and `uuid7.py` uses its pure Python
+implementation instead.
+"""
+
+from setuptools import Extension
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import CCompilerError, ExecError, PlatformError
+
+
+class OptionalBuildExt(build_ext):
+    "Build the C extensions, but don't fail if they can't be compiled"
+
+    def run(self):
+        try:
+            super().run()
+        except PlatformError as error:
+            print(f"WARNING: C extensions not built ({error})")
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except (CCompilerError, ExecError, PlatformError, ValueError) as error:
+            print(f"WARNING: C extension {ext.name} not built ({error})")
+
+
+def build(setup_kwargs):
+    "Add the C extensions to the setup arguments"
+    setup_kwargs.update(
+        cmdclass={'build_ext': OptionalBuildExt},
+        ext_modules=[Extension('_uuid7_fast', ['_uuid7_fast.c'])]
+    )
@@ -1,11 +1,31 @@
 #!/usr/bin/env python3
 
 from datetime import datetime, timezone
-from time import time
-from unittest import TestCase, main
-from uuid import UUID
-
-from uuid7 import _counters, uuid7, UUIDv7
+from os import _exit, close, pipe, read, waitpid, write
+from pickle import dumps, loads
+from random import Random
+from threading import Thread
+from time import time, time_ns
+from unittest import TestCase, main, skipIf
+from unittest.mock import patch
+from uuid import UUID, SafeUUID
+
+from uuid7 import (
+    _compose_data, _decompose_data, _get_counters, _get_rng,
+    _normalize_timestamp, _normalize_timestamp_now, _py_compose_data,
+    _py_decompose_data, _RandPool, _reset_rngs, _state, make_uuid7_generator,
+    uuid7, uuid7_array, uuid7_fast, uuid7_many, UUIDv7
+)
+
+try:
+    from os import fork
+except ImportError:  # Not available on Windows
+    fork = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 utc = timezone.utc
@@ -13,7 +33,7 @@ utc = timezone.utc
 
 class TestUUIDv7(TestCase):
     def setUp(self) -> None:
-        _counters.clear()
+        _state.counters = {}
 
     def test_uuid(self):
         "Test the creation of a UUIDv7 instance"
@@ -29,11 +49,19 @@ class TestUUIDv7(TestCase):
         self.assertIsInstance(uuid_instance.random, int)
         self.assertEqual(uuid_instance.datetime.tzinfo, utc)
 
+        # Test the bytes representation of a UUIDv7 instance
+        uuid_bytes = uuid_instance.bytes
+
+        self.assertEqual(uuid_bytes, UUID(int=uuid_instance.int).bytes)
+        self.assertIs(uuid_instance.bytes, uuid_bytes)
+
         # Test the string representation of a UUIDv7 instance
         uuid_str = str(uuid_instance)
 
         self.assertIsInstance(uuid_str, str)
         self.assertEqual(len(uuid_str), 36)  # UUID string length
+        self.assertEqual(uuid_str, str(UUID(int=uuid_instance.int)))
+        self.assertIs(str(uuid_instance), uuid_str)
 
         # Test the fields property of a UUIDv7 instance
         fields = uuid_instance.fields
@@ -56,6 +84,31 @@ class TestUUIDv7(TestCase):
 
         self.assertIsInstance(rand_b, int)
 
+    def test_uuid_default_same_timestamp(self):
+        "Test the creation of several UUIDv7 instances with default params"
+        uuid_instances = [uuid7() for _ in range(1000)]
+
+        self.assertEqual(len(set(uuid_instances)), len(uuid_instances))
+        self.assertEqual(_state.counters, {})
+
+    def test_uuid_fast(self):
+        "Test the creation of UUIDv7 instances with the fast path"
+        uuid_instances = [uuid7_fast() for _ in range(1000)]
+
+        self.assertEqual(len(set(uuid_instances)), len(uuid_instances))
+        self.assertEqual(_state.counters, {})
+
+        for uuid_instance in uuid_instances:
+            self.assertIsInstance(uuid_instance, UUIDv7)
+            self.assertEqual(uuid_instance.version, 7)
+            self.assertEqual(uuid_instance.variant, 'specified in RFC 4122')
+            self.assertEqual(uuid_instance.counter, 0)
+            self.assertEqual(
+                uuid_instance.random,
+                uuid_instance.rand_a << 62 | uuid_instance.rand_b
+            )
+            self.assertEqual(UUIDv7(int=uuid_instance.int), uuid_instance)
+
     def test_uuid_int(self):
         "Test the creation of a UUIDv7 instance with an integer"
         uuid_instance = uuid7(int=7 << 76 | 1 << 63)
@@ -76,6 +129,10 @@ class TestUUIDv7(TestCase):
         self.assertEqual(uuid_instance.rand_a, rand_a)
         self.assertEqual(uuid_instance.rand_b, rand_b)
 
+        self.assertEqual(uuid_instance.version, 7)
+        self.assertEqual(uuid_instance.is_safe, SafeUUID.unknown)
+        self.assertEqual(uuid_instance, UUIDv7(int=uuid_instance.int))
+
     def test_uuid_fields_invalid(self):
         "Test the creation of a UUIDv7 instance with invalid fields"
         with self.assertRaises(ValueError):
@@ -96,6 +153,18 @@ class TestUUIDv7(TestCase):
         with self.assertRaises(ValueError):
             uuid7(fields=(0, 0, -1))
 
+    def test_uuid_pickle(self):
+        "Test the fields of an unpickled UUIDv7 instance"
+        uuid_instance = uuid7(counter_num_bits=12)
+
+        unpickled = loads(dumps(uuid_instance))
+
+        self.assertEqual(unpickled, uuid_instance)
+        self.assertEqual(unpickled.fields, uuid_instance.fields)
+        self.assertEqual(unpickled.counter, uuid_instance.counter)
+        self.assertEqual(unpickled.datetime, uuid_instance.datetime)
+        self.assertEqual(unpickled.random, uuid_instance.random)
+
     def test_uuid_timestamp_field(self):
         "Test the creation of a UUIDv7 instance with full fields"
         timestamp = datetime.now(tz=utc)
@@ -118,6 +187,38 @@ class TestUUIDv7(TestCase):
         with self.assertRaises(ValueError):
             uuid7(timestamp='outatime')
 
+    def test_uuid_timestamp_datetime_exact(self):
+        "Test datetimes are converted without float rounding errors"
+        timestamp = datetime(2286, 11, 20, 17, 46, 39, 999999, tzinfo=utc)
+        microseconds = 9999999999999999
+
+        self.assertEqual(
+            _normalize_timestamp(timestamp),
+            (microseconds << 12) // 1000
+        )
+        self.assertEqual(
+            _normalize_timestamp(timestamp.astimezone().replace(tzinfo=None)),
+            _normalize_timestamp(timestamp)
+        )
+
+        uuid_instance = uuid7(
+            timestamp=timestamp, unix_ts_ms_fraction_num_bits=12
+        )
+
+        self.assertEqual(uuid_instance.unix_ts_ms, microseconds // 1000)
+
+    def test_uuid_timestamp_now(self):
+        "Test the current time is truncated to the timestamp fraction bits"
+        for unix_ts_ms_fraction_num_bits in range(13):
+            before = _normalize_timestamp(time_ns())
+            now = _normalize_timestamp_now(unix_ts_ms_fraction_num_bits)
+            after = _normalize_timestamp(time_ns())
+
+            shift = 12 - unix_ts_ms_fraction_num_bits
+
+            self.assertLessEqual(before >> shift, now)
+            self.assertLessEqual(now, after >> shift)
+
     def test_uuid_create_from_fields(self):
         "Test the creation of a UUIDv7 instance with full fields"
         counter_num_bits = 12
@@ -161,6 +262,63 @@ class TestUUIDv7(TestCase):
         self.assertEqual(uuid_instance2.unix_ts_ms, uuid_instance3.unix_ts_ms)
         self.assertLessEqual(uuid_instance2.counter, uuid_instance3.counter)
 
+    def test_uuid_counter_guard_seed_num_bits(self):
+        "Test the counter is seeded below its guard bits"
+        for _ in range(100):
+            _state.counters = {}
+
+            uuid_instance = uuid7(
+                counter_num_bits=42, counter_guard_seed_num_bits=30
+            )
+
+            self.assertLess(uuid_instance.counter, 1 << 12)
+            self.assertLess(uuid_instance.random, 1 << 32)
+            self.assertEqual(
+                uuid_instance.counter << 32 | uuid_instance.random,
+                uuid_instance.rand_a << 62 | uuid_instance.rand_b
+            )
+
+    def test_uuid_counter_num_bits_thread(self):
+        "Test the counters of each thread don't interfere with each other"
+        uuid7(counter_num_bits=12)
+
+        counters = dict(_state.counters)
+
+        thread = Thread(target=uuid7, kwargs={'counter_num_bits': 12})
+        thread.start()
+        thread.join()
+
+        self.assertEqual(_state.counters, counters)
+
+    def test_uuid_counters_cleared(self):
+        "Test the counters are seeded again after clearing them"
+        with patch('uuid7.time_ns', return_value=time_ns()):
+            uuid7(counter_num_bits=12)
+
+            _get_counters().clear()
+
+            uuid_instance = uuid7(counter_num_bits=12)
+
+        self.assertEqual(_get_counters(), {
+            (0, 12): [
+                uuid_instance.unix_ts_ms, uuid_instance.counter,
+                uuid_instance.random
+            ]
+        })
+
+    def test_uuid_get_counters_thread(self):
+        "Test each thread gets its own counters"
+        counters = _get_counters()
+        thread_counters = []
+
+        thread = Thread(target=lambda: thread_counters.append(_get_counters()))
+        thread.start()
+        thread.join()
+
+        self.assertIs(_get_counters(), counters)
+        self.assertEqual(thread_counters, [{}])
+        self.assertIsNot(thread_counters[0], counters)
+
     def test_uuid_counter_field(self):
         "Test the creation of a UUIDv7 instance with a counter field"
         counter_num_bits = 6
@@ -270,6 +428,52 @@ class TestUUIDv7(TestCase):
 
         self.assertEqual(uuid_instance2.counter, counter)
 
+    def test_uuid_non_cryptographic(self):
+        "Test the creation of a UUIDv7 instance with a non-cryptographic RNG"
+        uuid_instance1 = uuid7(counter_num_bits=12, cryptographic=False)
+
+        self.assertIsInstance(uuid_instance1, UUIDv7)
+        self.assertEqual(uuid_instance1.version, 7)
+
+        uuid_instance2 = uuid7(counter_num_bits=12, cryptographic=False)
+
+        self.assertNotEqual(uuid_instance1, uuid_instance2)
+        self.assertLessEqual(uuid_instance1, uuid_instance2)
+
+    def test_uuid_non_cryptographic_default(self):
+        "Test the default random generator can be changed for all the UUIDs"
+        self.assertIsInstance(_get_rng(), _RandPool)
+
+        with patch('uuid7.CRYPTOGRAPHIC_RANDOM', False):
+            self.assertIsInstance(_get_rng(), Random)
+            self.assertIsInstance(_get_rng(True), _RandPool)
+
+            uuid_instance = uuid7()
+
+        self.assertEqual(uuid_instance.version, 7)
+
+    def test_uuid_monotonic_random_frozen_invalid_num_bits(self):
+        "Test the counter bits are checked with a frozen monotonic random"
+        with self.assertRaises(AssertionError):
+            uuid7(monotonic_random=True, random=0, counter_num_bits=75)
+
+        with self.assertRaises(AssertionError):
+            uuid7(
+                monotonic_random=True, random=0, counter=0,
+                counter_num_bits=-1
+            )
+
+    def test_uuid_no_validate(self):
+        "Test the arguments checks can be skipped"
+        with self.assertRaises(AssertionError):
+            uuid7(counter_num_bits=6)
+
+        with patch('uuid7.VALIDATE', False):
+            uuid_instance = uuid7(counter_num_bits=6)
+
+        self.assertEqual(uuid_instance.version, 7)
+        self.assertLess(uuid_instance.counter, 1 << 6)
+
     def test_uuid_counter_step_frozen_random(self):
         "Test the creation of a UUIDv7 instance with a frozen random field"
         random = 0
@@ -278,6 +482,358 @@ class TestUUIDv7(TestCase):
 
         self.assertEqual(uuid_instance.random, random)
 
+    def test_uuid_compose_data(self):
+        "Test the composed UUIDs decompose back into their values"
+        for unix_ts_ms_fraction_num_bits, counter_num_bits in (
+            (0, 0), (0, 12), (0, 74), (12, 0), (12, 42), (12, 62)
+        ):
+            random_num_bits = (
+                74 - unix_ts_ms_fraction_num_bits - counter_num_bits
+            )
+
+            unix_ts_ms_with_fraction = (
+                (1 << (48 + unix_ts_ms_fraction_num_bits)) // 3
+            )
+            counter = (1 << counter_num_bits) // 5
+            random = (1 << random_num_bits) // 7
+
+            uuid_instance = uuid7(
+                int=_py_compose_data(
+                    unix_ts_ms_with_fraction, unix_ts_ms_fraction_num_bits,
+                    counter, random_num_bits, random
+                ),
+                unix_ts_ms_fraction_num_bits=unix_ts_ms_fraction_num_bits,
+                counter_num_bits=counter_num_bits
+            )
+
+            self.assertEqual(
+                uuid_instance.unix_ts_ms,
+                unix_ts_ms_with_fraction >> unix_ts_ms_fraction_num_bits
+            )
+            self.assertEqual(uuid_instance.counter, counter)
+            self.assertEqual(uuid_instance.random, random)
+
+
+class TestRandPool(TestCase):
+    def test_getrandbits(self):
+        "Test the random bits of any width are below its limit"
+        rand_pool = _RandPool()
+
+        for num_bits in (1, 7, 8, 9, 12, 42, 62, 63, 64, 65, 74):
+            for _ in range(100):
+                self.assertLess(rand_pool.getrandbits(num_bits), 1 << num_bits)
+
+        self.assertEqual(rand_pool.getrandbits(0), 0)
+
+    def test_getrandbits_refill(self):
+        "Test the pool is refilled when it doesn't have enough bytes"
+        blocks = iter((bytes(range(16)), bytes(range(16, 32))))
+
+        with patch('uuid7.RAND_POOL_SIZE', 16), \
+             patch('uuid7.urandom', side_effect=lambda size: next(blocks)):
+            rand_pool = _RandPool()
+
+            self.assertEqual(rand_pool.getrandbits(0), 0)
+            self.assertEqual(
+                rand_pool.getrandbits(64),
+                int.from_bytes(bytes(range(8)), 'big')
+            )
+            self.assertEqual(rand_pool.getrandbits(12), 0x0809 >> 4)
+            self.assertEqual(rand_pool.pos, 10)
+
+            # Only 6 bytes are left, so the next 7 bytes are read from a new
+            # block and the remaining ones are discarded
+            self.assertEqual(
+                rand_pool.getrandbits(50),
+                int.from_bytes(bytes(range(16, 23)), 'big') >> 6
+            )
+            self.assertEqual(rand_pool.pos, 7)
+
+    def test_reset_rngs(self):
+        "Test the random generators are discarded"
+        rand_pool = _get_rng(True)
+        random = _get_rng(False)
+
+        _reset_rngs()
+
+        self.assertIsNot(_get_rng(True), rand_pool)
+        self.assertIsNot(_get_rng(False), random)
+
+    @skipIf(fork is None, "fork() is not available")
+    def test_fork(self):
+        "Test forked processes don't share the random pool"
+        _get_rng().getrandbits(74)  # Fill the pool
+
+        read_fd, write_fd = pipe()
+
+        pid = fork()
+        if not pid:  # Child
+            try:
+                write(write_fd, _get_rng().getrandbits(64).to_bytes(8, 'big'))
+            finally:
+                _exit(0)
+
+        close(write_fd)
+        waitpid(pid, 0)
+
+        child_random = int.from_bytes(read(read_fd, 8), 'big')
+        close(read_fd)
+
+        self.assertNotEqual(child_random, _get_rng().getrandbits(64))
+
+
+@skipIf(_compose_data is _py_compose_data, "C extension is not built")
+class TestUUIDv7FastCompose(TestCase):
+    def test_compose_data(self):
+        "Test the C extension composes the same UUIDs as the Python version"
+        for unix_ts_ms_fraction_num_bits, counter_num_bits in (
+            (0, 0), (0, 12), (0, 74), (12, 0), (12, 42), (12, 62)
+        ):
+            random_num_bits = (
+                74 - unix_ts_ms_fraction_num_bits - counter_num_bits
+            )
+
+            args = (
+                (1 << (48 + unix_ts_ms_fraction_num_bits)) - 1,
+                unix_ts_ms_fraction_num_bits,
+                (1 << counter_num_bits) - 1,
+                random_num_bits,
+                (1 << random_num_bits) // 3
+            )
+
+            self.assertEqual(_compose_data(*args), _py_compose_data(*args))
+
+    def test_decompose_data(self):
+        "Test the C extension decomposes the same values as the Python one"
+        for unix_ts_ms_fraction_num_bits, counter_num_bits in (
+            (0, 0), (0, 12), (0, 74), (12, 0), (12, 42), (12, 62)
+        ):
+            for fields in (
+                (0, 0, 0),
+                ((1 << 48) - 1, (1 << 12) - 1, (1 << 62) - 1),
+                ((1 << 48) // 3, (1 << 12) // 5, (1 << 62) // 7)
+            ):
+                args = (
+                    *fields, unix_ts_ms_fraction_num_bits, counter_num_bits
+                )
+
+                self.assertEqual(
+                    _decompose_data(*args), _py_decompose_data(*args)
+                )
+
+        with self.assertRaises(ValueError):
+            _decompose_data(1 << 48, 0, 0, 0, 0)
+
+        with self.assertRaises(ValueError):
+            _decompose_data(0, 0, 0, 12, 63)
+
+
+class TestMakeUUIDv7Generator(TestCase):
+    def setUp(self) -> None:
+        _state.counters = {}
+
+    def test_generator(self):
+        "Test the generation of UUIDv7 instances with a generator"
+        generate = make_uuid7_generator(counter_num_bits=12)
+
+        self.assertIs(make_uuid7_generator(counter_num_bits=12), generate)
+
+        uuid_instance1 = generate()
+
+        self.assertIsInstance(uuid_instance1, UUIDv7)
+        self.assertEqual(uuid_instance1.version, 7)
+        self.assertIsInstance(uuid_instance1.datetime, datetime)
+
+        uuid_instance2 = generate()
+
+        self.assertLess(uuid_instance1, uuid_instance2)
+        self.assertEqual(
+            uuid7(int=uuid_instance2.int, counter_num_bits=12).counter,
+            uuid_instance2.counter
+        )
+
+    def test_generator_stateless(self):
+        "Test the generation of UUIDv7 instances with the default generator"
+        generate = make_uuid7_generator()
+
+        uuid_instances = [generate() for _ in range(1000)]
+
+        self.assertEqual(len(set(uuid_instances)), len(uuid_instances))
+        self.assertEqual(_state.counters, {})
+
+        for uuid_instance in uuid_instances:
+            self.assertIsInstance(uuid_instance, UUIDv7)
+            self.assertEqual(uuid_instance.version, 7)
+            self.assertEqual(uuid_instance.counter, 0)
+            self.assertLess(uuid_instance.random, 1 << 74)
+
+        # With a timestamp fraction, there's no counter to keep track of too
+        uuid_instance = make_uuid7_generator(
+            unix_ts_ms_fraction_num_bits=12
+        )()
+
+        self.assertEqual(uuid_instance.counter, 0)
+        self.assertLess(uuid_instance.random, 1 << 62)
+        self.assertEqual(_state.counters, {})
+
+    def test_generator_invalid(self):
+        "Test the generator parameters are validated on creation"
+        with self.assertRaises(AssertionError):
+            make_uuid7_generator(unix_ts_ms_fraction_num_bits=13)
+
+        with self.assertRaises(AssertionError):
+            make_uuid7_generator(counter_num_bits=6)
+
+
+class TestUUIDv7Many(TestCase):
+    def setUp(self) -> None:
+        _state.counters = {}
+
+    def test_many(self):
+        "Test the generation of a batch of UUIDv7 instances"
+        uuid_instances = uuid7_many(1000)
+
+        self.assertEqual(len(uuid_instances), 1000)
+        self.assertEqual(len(set(uuid_instances)), 1000)
+
+        for uuid_instance in uuid_instances:
+            self.assertIsInstance(uuid_instance, UUIDv7)
+            self.assertEqual(uuid_instance.version, 7)
+            self.assertEqual(uuid_instance.counter, 0)
+            self.assertLess(uuid_instance.random, 1 << 74)
+
+    def test_many_fraction(self):
+        "Test the generation of a batch with a timestamp fraction"
+        uuid_instances = uuid7_many(
+            10, unix_ts_ms_fraction_num_bits=12, cryptographic=False
+        )
+
+        self.assertEqual(len(set(uuid_instances)), 10)
+
+        for uuid_instance in uuid_instances:
+            self.assertLess(uuid_instance.random, 1 << 62)
+
+    def test_many_counter(self):
+        "Test the generation of a batch of UUIDv7 instances with a counter"
+        uuid_instances = uuid7_many(
+            100, counter_num_bits=42, counter_guard_seed_num_bits=1
+        )
+
+        self.assertEqual(uuid_instances, sorted(uuid_instances))
+
+
+@skipIf(numpy is None, "NumPy is not installed")
+class TestUUIDv7Array(TestCase):
+    def setUp(self) -> None:
+        _state.counters = {}
+
+    def test_array(self):
+        "Test the generation of a batch of UUIDv7 as NumPy arrays"
+        hi, lo = uuid7_array(1000)
+
+        self.assertEqual(hi.dtype, numpy.uint64)
+        self.assertEqual(lo.dtype, numpy.uint64)
+        self.assertEqual(len(hi), 1000)
+        self.assertEqual(len(lo), 1000)
+
+        uuid_instances = [
+            UUIDv7(int=int(h) << 64 | int(l)) for h, l in zip(hi, lo)
+        ]
+
+        self.assertEqual(len(set(uuid_instances)), 1000)
+
+        for uuid_instance in uuid_instances:
+            self.assertEqual(uuid_instance.version, 7)
+            self.assertEqual(uuid_instance.variant, 'specified in RFC 4122')
+
+    def test_array_fraction(self):
+        "Test the timestamp fraction of a batch of UUIDv7 as NumPy arrays"
+        hi, lo = uuid7_array(
+            10, unix_ts_ms_fraction_num_bits=12, cryptographic=False
+        )
+
+        datetimes = {
+            UUIDv7(
+                int=int(h) << 64 | int(l), unix_ts_ms_fraction_num_bits=12
+            ).datetime
+            for h, l in zip(hi, lo)
+        }
+
+        self.assertEqual(len(datetimes), 1)
+
+    def test_array_counter(self):
+        "Test a batch of UUIDv7 as NumPy arrays has consecutive counters"
+        for unix_ts_ms_fraction_num_bits, counter_num_bits in (
+            (0, 12), (0, 42), (0, 74), (4, 5), (12, 50), (12, 62)
+        ):
+            _state.counters = {}
+
+            n = min(1000, 1 << (counter_num_bits - 1))
+
+            hi, lo = uuid7_array(
+                n, unix_ts_ms_fraction_num_bits=unix_ts_ms_fraction_num_bits,
+                counter_guard_seed_num_bits=1,
+                counter_num_bits=counter_num_bits,
+                counter_use_spec_recommended_num_bits=False
+            )
+
+            uuid_instances = [
+                UUIDv7(
+                    int=int(h) << 64 | int(l),
+                    unix_ts_ms_fraction_num_bits=unix_ts_ms_fraction_num_bits,
+                    counter_num_bits=counter_num_bits
+                )
+                for h, l in zip(hi, lo)
+            ]
+
+            counter = uuid_instances[0].counter
+
+            self.assertEqual(uuid_instances, sorted(uuid_instances))
+            self.assertEqual(
+                [uuid_instance.counter for uuid_instance in uuid_instances],
+                list(range(counter, counter + n))
+            )
+            self.assertLess(counter, 1 << (counter_num_bits - 1))
+
+        with self.assertRaises(AssertionError):
+            uuid7_array(
+                33, counter_num_bits=5,
+                counter_use_spec_recommended_num_bits=False
+            )
+
+    def test_array_counter_continued(self):
+        "Test the counters of a batch continue the ones of the previous UUIDs"
+        with patch('uuid7.time_ns', return_value=time_ns()):
+            uuid_instance = uuid7(counter_num_bits=42)
+
+            hi1, lo1 = uuid7_array(5, counter_num_bits=42)
+            hi2, lo2 = uuid7_array(5, counter_num_bits=42)
+
+            uuid_instance2 = uuid7(counter_num_bits=42)
+
+        uuid_instances = [
+            UUIDv7(int=int(h) << 64 | int(l), counter_num_bits=42)
+            for h, l in zip([*hi1, *hi2], [*lo1, *lo2])
+        ]
+
+        self.assertEqual(
+            [uuid_instance.counter for uuid_instance in uuid_instances],
+            list(range(uuid_instance.counter + 1, uuid_instance.counter + 11))
+        )
+        self.assertEqual(uuid_instance2.counter, uuid_instance.counter + 11)
+        self.assertEqual(
+            sorted([uuid_instance, *uuid_instances, uuid_instance2]),
+            [uuid_instance, *uuid_instances, uuid_instance2]
+        )
+
+    def test_array_counter_num_bits(self):
+        "Test the counter of a batch follows the spec recommended bits"
+        with self.assertRaises(AssertionError):
+            uuid7_array(5, counter_num_bits=5)
+
+        with self.assertRaises(AssertionError):
+            uuid7_array(5, counter_num_bits=43)
+
 
 if __name__ == '__main__':
     main()
@@ -23,81 +23,300 @@ License:
     MIT
 """
 
-from datetime import datetime, timezone
-from functools import cached_property
-from math import floor
-from random import SystemRandom
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from os import urandom
+from threading import local
 from time import time_ns
-from uuid import UUID
+from uuid import UUID, SafeUUID
+
+# `random` is only imported when needed (see `_get_fast_rng()`), but type
+# checkers need it for the annotations. Don't import `typing` just for its
+# `TYPE_CHECKING`, since it's several times slower to import than `random`.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from random import Random
 
 
 NS_IN_MS = 1_000_000  # Nanoseconds in a millisecond
+RAND_POOL_SIZE = 4096  # Bytes read from `os.urandom()` on each refill
+
+# Default random generator when `cryptographic` is not given. Set it to
+# `False` to use the faster Mersenne Twister generator in all the process.
+CRYPTOGRAPHIC_RANDOM = True
+
+# Check the arguments of `UUIDv7()` on each call. Set it to `False` to skip
+# them when they are known to be valid. Runtime checks like the counter
+# overflow are done anyway.
+VALIDATE = True
+
+# Convert seconds to milliseconds with 12 bits fraction in one multiplication
+_S_TO_MS_12BITS = 1000.0 * (1 << 12)
+
+_UTC = timezone.utc  # Avoid the attribute lookup on each call
+
+# Convert datetimes to microseconds since the epoch with integer arithmetic
+_EPOCH = datetime(1970, 1, 1, tzinfo=_UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Bit masks for any width of the 74 bits payload (timestamp fraction, counter
+# and random), so they don't need to be computed on each call
+_MASK = tuple((1 << num_bits) - 1 for num_bits in range(75))
+
+_MASK62 = _MASK[62]  # `rand_b` field
+_VERSION_BITS = 0b0111 << 76  # UUID version 7
+_VARIANT_BITS = 0b10 << 62  # UUID variant (RFC 9562)
+
+# Convert milliseconds with fraction to seconds for each fraction width
+_FRAC_DIVISOR = tuple(1000.0 * (1 << num_bits) for num_bits in range(13))
+
+_SAFE_UUID_UNKNOWN = SafeUUID.unknown  # Enum members lookup is slow
+
 
+# Keep track of the last timestamp, counter and random values for each
+# timestamp fraction and counter bit lengths. State is kept for each thread,
+# so they don't need to be locked and can't corrupt each other counters, at
+# the cost of UUIDs being monotonic only within the thread that generated
+# them.
+_state = local()
+
+
+class _RandPool:
+    """Pool of cryptographically secure random bytes
+
+    Bytes are read from `os.urandom()` in blocks of `RAND_POOL_SIZE` and
+    served on demand, so the syscall cost is amortized over several UUIDs
+    instead of being paid on each one of them.
+    """
+
+    __slots__ = ('buf', 'pos')
+
+    def __init__(self):
+        self.buf = b''
+        self.pos = 0
+
+    def getrandbits(self, nbits: int) -> int:
+        "Return an int with `nbits` random bits"
+        nbytes = (nbits + 7) // 8
+        pos = self.pos
+
+        if pos + nbytes > len(self.buf):
+            self.buf = urandom(RAND_POOL_SIZE)
+            pos = 0
+
+        self.pos = pos + nbytes
+
+        return (
+            int.from_bytes(self.buf[pos:pos + nbytes], 'big') >>
+            (nbytes * 8 - nbits)
+        )
 
-# Keep track of the last timestamp and counter for each bit length
-_counters = {}
 
-_random = SystemRandom()
-_getrandbits = _random.getrandbits
-_randrange = _random.randrange
+# Keep the random generators for each thread, so they don't need to be locked
+_rngs = local()
+
+
+def _get_counters() -> dict:
+    "Get the counters of the current thread"
+    try:
+        return _state.counters
+    except AttributeError:
+        counters = _state.counters = {}
+        return counters
+
+
+def _get_fast_rng() -> 'Random':
+    "Get the non cryptographic random generator of the current thread"
+    try:
+        return _rngs.fast
+    except AttributeError:
+        # Import it only when needed, so it isn't paid on import time
+        from random import Random
+
+        fast = _rngs.fast = Random(urandom(32))
+        return fast
+
+
+def _get_rng(cryptographic: None | bool = None) -> '_RandPool | Random':
+    """Get the random generator of the current thread
+
+    If `cryptographic` is `False`, return a Mersenne Twister generator
+    seeded from `os.urandom()` instead of the random pool. It's faster,
+    but its output is predictable once enough of it has been observed. If
+    it's `None`, use the `CRYPTOGRAPHIC_RANDOM` default.
+    """
+    if cryptographic is None:
+        cryptographic = CRYPTOGRAPHIC_RANDOM
+
+    try:
+        return _rngs.pool if cryptographic else _rngs.fast
+    except AttributeError:
+        if not cryptographic:
+            return _get_fast_rng()
+
+        pool = _rngs.pool = _RandPool()
+        return pool
+
+
+def _reset_rngs():
+    "Discard the random generators, so forked processes don't share them"
+    global _rngs
+    _rngs = local()
+
+
+try:
+    from os import register_at_fork
+except ImportError:  # Not available on Windows
+    pass
+else:
+    register_at_fork(after_in_child=_reset_rngs)
 
 
 def _calc_counter_and_random(
     unix_ts_ms_fraction_num_bits: int, counter_num_bits: int,
     monotonic_random: bool, counter: None | int,
     counter_guard_seed_num_bits: int, counter_step: int, random: None | int,
-    unix_ts_ms_with_fraction: int, random_num_bits: int
+    unix_ts_ms_with_fraction: int, random_num_bits: int,
+    getrandbits: Callable[[int], int]
 ):
     "Calculate the counter and random values"
 
-    # Get the last timestamp and counters for the given timestamp fraction
-    last_timestamp, counters = _counters.get(
-        unix_ts_ms_fraction_num_bits, (0, {})
-    )
+    counters = _get_counters()
+
+    # Most processes use a single bits layout, so keep its entry at hand to
+    # don't need to build and hash the key on each call. It's checked
+    # against the counters dict too, in case it has been replaced or cleared
+    # (so it's empty). Single entries must not be removed from it, since
+    # that can't be detected without looking up the key.
+    try:
+        (
+            last_counters, last_unix_ts_ms_fraction_num_bits,
+            last_counter_num_bits, entry
+        ) = _state.last_entry
+    except AttributeError:
+        last_counters = None
+
+    if not (
+        counters and
+        last_counters is counters and
+        last_unix_ts_ms_fraction_num_bits == unix_ts_ms_fraction_num_bits and
+        last_counter_num_bits == counter_num_bits
+    ):
+        entry = counters.setdefault(
+            (unix_ts_ms_fraction_num_bits, counter_num_bits), [0, None, None]
+        )
+
+        _state.last_entry = (
+            counters, unix_ts_ms_fraction_num_bits, counter_num_bits, entry
+        )
+
+    # Get the last timestamp, counter and random values for the given
+    # timestamp fraction and counter bit lengths
+    last_timestamp, last_counter, last_random = entry
 
     assert last_timestamp <= unix_ts_ms_with_fraction, (
         "Timestamps are not monotonic"
     )
 
-    # Get the last counter and random values for the given timestamp
-    # fraction and counter bit length
-    if (
-        last_timestamp < unix_ts_ms_with_fraction or
-        counter_num_bits not in counters
-    ):
+    # Counter and random values are only relevant for the same timestamp
+    if last_timestamp < unix_ts_ms_with_fraction:
         last_counter = last_random = None
-    else:
-        last_counter, last_random = counters[counter_num_bits]
 
     # Calculate the counter and random values
     if monotonic_random:  # Monotonic Random (Method 2)
-        counter, random = _counter_method2(
-            counter_num_bits, counter, counter_guard_seed_num_bits,
-            counter_step, random, random_num_bits, last_counter, last_random
-        )
+        # Neither `counter` nor `random` are provided, the most common case.
+        # It's inlined to save the function call, like Method 1.
+        if counter is None and random is None:
+            random = getrandbits(random_num_bits)
 
-    else:  # Fixed Bit-Length Dedicated Counter (Method 1)
-        counter, random = _counter_method1(
-            counter_num_bits, counter, counter_guard_seed_num_bits,
-            counter_step, random, random_num_bits, last_counter
-        )
+            # Seed the counter and random if timestamp has changed
+            if last_random is None:  # `last_counter` is None, too
+                counter = 0
 
-    # Update the counters
-    counters[counter_num_bits] = (counter, random)
+            else:
+                # Increment the random
+                random += last_random + 1
 
-    _counters[unix_ts_ms_fraction_num_bits] = (
-        unix_ts_ms_with_fraction, counters
-    )
+                if random <= _MASK[random_num_bits]:
+                    counter = last_counter
+
+                else:
+                    # Increment counter if random overflows (rollover)
+                    assert counter_num_bits, \
+                        "Counter is required as guard for random overflow"
+
+                    counter = _increment_counter(
+                        counter_num_bits, counter_guard_seed_num_bits,
+                        counter_step, last_counter, getrandbits
+                    )
+                    random &= _MASK[random_num_bits]  # Truncate the overflow
+
+        else:
+            counter, random = _counter_method2(
+                counter_num_bits, counter, counter_guard_seed_num_bits,
+                counter_step, random, random_num_bits, last_counter,
+                last_random, getrandbits
+            )
+
+    # Fixed Bit-Length Dedicated Counter (Method 1). It's the most common
+    # one and it's short, so it's inlined to save the function calls.
+    else:
+        if counter is None:
+            if last_counter is not None:
+                counter = last_counter + counter_step
+
+                # Check the counter doesn't overflow (rollover)
+                assert counter <= _MASK[counter_num_bits], "Counter overflow"
+
+            # Seed the counter and random if timestamp has changed
+            elif random is None:
+                counter, random = _init_counter_and_random(
+                    counter_num_bits, counter_guard_seed_num_bits,
+                    random_num_bits, getrandbits
+                )
+
+            else:
+                counter = _init_counter(
+                    counter_num_bits, counter_guard_seed_num_bits, getrandbits
+                )
+
+        elif last_counter is not None:
+            assert last_counter < counter
+
+        if random is None:
+            random = getrandbits(random_num_bits)
+
+    # Update the counters in place
+    entry[0] = unix_ts_ms_with_fraction
+    entry[1] = counter
+    entry[2] = random
 
     # Return the counter and random values
     return counter, random
 
 
-def _compose_data(
+def _py_compose_data(
     unix_ts_ms_with_fraction, unix_ts_ms_fraction_num_bits, counter,
     random_num_bits, random
 ):
     "Compose the data with the timestamp, counters and random data"
+    if not unix_ts_ms_fraction_num_bits:
+        # Without timestamp fraction, the timestamp is exactly the
+        # `unix_ts_ms` field, so only the counters and random data need to
+        # be split between the `rand_a` and `rand_b` fields. Without counter
+        # (the plain RFC 9562 layout), data is just the random.
+        data = counter << random_num_bits | random if counter else random
+
+        return (
+            (unix_ts_ms_with_fraction << 80) |
+            _VERSION_BITS |
+            (data >> 62) << 64 |
+            _VARIANT_BITS |
+            data & _MASK62
+        )
+
     # Compose data with timestamp, counters and random data. We are not
     # doing it directly since values can span over both `rand_a` and
     # `rand_b` fields in a non-fixed way, so we'll split them later.
@@ -107,90 +326,85 @@ def _compose_data(
         random
     )
 
-    # Split the random number into the `unix_ts_ms` and the two random
-    # fields
-    unix_ts_ms = data >> 74
-    rand_a = data >> 62 & 0x0fff
-    rand_b = data & ~(~0 << 62)
-
-    # Construct the UUID7 integer
-    return _construct_uuid7_int(unix_ts_ms, rand_a, rand_b)
-
-
-def _compose_uuid(
-    timestamp, unix_ts_ms_fraction_num_bits, counter,
-    counter_guard_seed_num_bits, counter_num_bits, counter_step,
-    counter_use_spec_recommended_num_bits, monotonic_random, random
-):
-    # Validate the input
-    assert 0 <= unix_ts_ms_fraction_num_bits <= 12, (
-        "Invalid number of bits for the timestamp fraction"
+    # Split the data into the `unix_ts_ms`, `rand_a` and `rand_b` fields
+    # and stamp the version and variant bits in a single expression, so
+    # there are no intermediate values
+    return (
+        (data >> 74 << 80) |
+        _VERSION_BITS |
+        (data >> 62 & 0x0fff) << 64 |
+        _VARIANT_BITS |
+        data & _MASK62
     )
 
-    if monotonic_random:
-        if random is None:
-            assert (
-                0 <= counter_num_bits <= 74 - unix_ts_ms_fraction_num_bits
-            ), "Invalid number of bits for the counter (monotonic random guard)"
 
-            assert timestamp is None, (
-                "Random is required when timestamp is provided"
-            )
+try:
+    # Compose the UUID with two 64 bits words instead of with big ints
+    from _uuid7_fast import compose as _compose_data
+except ImportError:  # C extension is not built, use the pure Python version
+    _compose_data = _py_compose_data
 
-    elif counter_num_bits:
-        if counter_use_spec_recommended_num_bits:
-            assert 12 <= counter_num_bits <= 42, (
-                "Invalid number of bits for the counter"
-            )
-        else:
-            assert (
-                0 < counter_num_bits <= 74 - unix_ts_ms_fraction_num_bits
-            ), "Invalid number of bits for the counter"
 
-    if counter is None:
-        assert 0 <= counter_guard_seed_num_bits <= counter_num_bits, (
-            "Invalid number of bits for the counter guard seed"
-        )
+def _compose_default_uuid(getrandbits: Callable[[int], int]):
+    """Compose a UUID with the default parameters
 
-        if counter_num_bits:
-            assert timestamp is None, (
-                "Counter is required when timestamp is provided"
-            )
+    There's no timestamp fraction, counter nor monotonic random, so it
+    doesn't need any validation nor state, and it's composed in a single
+    expression.
+    """
+    unix_ts_ms = time_ns() // NS_IN_MS
+    random = getrandbits(74)
 
-            assert 0 < counter_step < (1 << counter_num_bits), (
-                "Invalid number of bits for the counter step"
-            )
-    else:
-        assert counter_num_bits, "counter_num_bits is required"
-        assert 0 <= counter < (1 << counter_num_bits), (
-            "Invalid number of bits for the counter"
-        )
+    int = (
+        (unix_ts_ms << 80) |
+        _VERSION_BITS |
+        (random >> 62) << 64 |
+        _VARIANT_BITS |
+        random & _MASK62
+    )
 
-    random_num_bits = 74 - unix_ts_ms_fraction_num_bits - counter_num_bits
+    return int, unix_ts_ms, random
 
-    if random is not None:
-        assert 0 <= random < (1 << random_num_bits), (
-            "Invalid number of bits for the frozen random counter step"
-        )
 
-    # Timestamp in milliseconds (with 12 bits fraction)
-    unix_ts_ms_with_12bits_fraction = _normalize_timestamp(timestamp)
+def _compose_uuid(
+    timestamp, unix_ts_ms_fraction_num_bits, counter,
+    counter_guard_seed_num_bits, counter_num_bits, counter_step,
+    counter_use_spec_recommended_num_bits, monotonic_random, random,
+    getrandbits
+):
+    if VALIDATE:
+        random_num_bits = _validate(
+            timestamp, unix_ts_ms_fraction_num_bits, counter,
+            counter_guard_seed_num_bits, counter_num_bits, counter_step,
+            counter_use_spec_recommended_num_bits, monotonic_random, random
+        )
+    else:
+        random_num_bits = 74 - unix_ts_ms_fraction_num_bits - counter_num_bits
 
-    # OPTIONAL sub-milliseconds timestamp fraction
+    # Timestamp in milliseconds, with OPTIONAL sub-milliseconds fraction
     # Replace Leftmost Random Bits with Increased Clock Precision
     # (Method 3)
     unix_ts_ms_with_fraction = (
-        unix_ts_ms_with_12bits_fraction >> (
-            12 - unix_ts_ms_fraction_num_bits
-        )
+        _normalize_timestamp_now(unix_ts_ms_fraction_num_bits)
+        if timestamp is None else
+        _normalize_timestamp(timestamp) >> (12 - unix_ts_ms_fraction_num_bits)
     )
 
     # OPTIONAL carefully seeded counter
-    if timestamp is None:
+    if not (counter_num_bits or monotonic_random):
+        # There's no counter nor monotonic random to keep track of, so the
+        # UUID is just the timestamp and fresh random bits
+        counter = 0
+
+        if random is None:
+            random = getrandbits(random_num_bits)
+
+    elif timestamp is None:
         counter, random = _calc_counter_and_random(
             unix_ts_ms_fraction_num_bits, counter_num_bits,
             monotonic_random, counter, counter_guard_seed_num_bits,
-            counter_step, random, unix_ts_ms_with_fraction, random_num_bits
+            counter_step, random, unix_ts_ms_with_fraction, random_num_bits,
+            getrandbits
         )
 
     else:
@@ -199,53 +413,38 @@ def _compose_uuid(
         # we'll use them as provided
         if counter is None:
             counter = _init_counter(
-                counter_num_bits, counter_guard_seed_num_bits
+                counter_num_bits, counter_guard_seed_num_bits, getrandbits
             )
 
         if random is None:
-            random = _getrandbits(random_num_bits)
+            random = getrandbits(random_num_bits)
 
-    return _compose_data(
+    int = _compose_data(
         unix_ts_ms_with_fraction, unix_ts_ms_fraction_num_bits,
         counter, random_num_bits, random
     )
 
+    return int, unix_ts_ms_with_fraction, counter, random
+
 
 def _construct_uuid7_int(unix_ts_ms, rand_a, rand_b):
     return (
         (unix_ts_ms << 80) |
-        (0b0111 << 76) |  # UUID version 7
+        _VERSION_BITS |
         (rand_a << 64) |
-        (0b10 << 62) |  # UUID variant (RFC 9562)
+        _VARIANT_BITS |
         rand_b
     )
 
-def _counter_method1(
-    counter_num_bits, counter, counter_guard_seed_num_bits, counter_step,
-    random, random_num_bits, last_counter
-) -> tuple[int, int]:
-    "Fixed Bit-Length Dedicated Counter (Method 1)"
-
-    if counter is None:
-        counter = _increment_counter(
-            counter_num_bits, counter_guard_seed_num_bits, counter_step,
-            last_counter
-        )
-
-    elif last_counter is not None:
-        assert last_counter < counter
-
-    if random is None:
-        random = _getrandbits(random_num_bits)
-
-    return counter, random
-
-
 def _counter_method2(
     counter_num_bits, counter, counter_guard_seed_num_bits, counter_step,
-    random, random_num_bits, last_counter, last_random
+    random, random_num_bits, last_counter, last_random, getrandbits
 ) -> tuple[int, int]:
-    "Monotonic Random (Method 2)"
+    """Monotonic Random (Method 2) with a provided `counter` or `random`
+
+    The most common case, where neither of them are provided, is inlined in
+    `_calc_counter_and_random()`.
+    """
 
     # Use `random` if provided and valid
     if random is not None:
@@ -264,72 +463,85 @@ def _counter_method2(
 
         return counter, random
 
-    # Use `counter` if provided and valid
-    if counter is not None:
-        if last_counter is None:
-            random = _getrandbits(random_num_bits)
+    # Use `counter` if provided and valid. If it's the same of the last one
+    # (so `last_random` is not None, too), random must be above the last one
+    if last_counter is not None:
+        assert last_counter <= counter
 
-        # `last_random` is not None, too
-        else:
-            assert last_counter <= counter
-
-            random = (
-                _getrandbits(random_num_bits)
-                if last_counter < counter else
-                _randrange(last_random, 1 << random_num_bits)
+        if last_counter == counter:
+            return counter, _random_above(
+                last_random, random_num_bits, getrandbits
             )
 
-        return counter, random
-
-    random = _getrandbits(random_num_bits)
-
-    # Seed the counter and random if timestamp has changed
-    if last_random is None:  # `last_counter` is None, too
-        return 0, random
+    return counter, getrandbits(random_num_bits)
 
-    # Increment the random
-    random = last_random + 1 + random
 
-    if random < (1 << random_num_bits):
-        return last_counter, random
+def _py_decompose_data(
+    unix_ts_ms, rand_a, rand_b, unix_ts_ms_fraction_num_bits, counter_num_bits
+):
+    "Decompose the fields into the timestamp, counters and random data"
+    data = unix_ts_ms << 74 | rand_a << 62 | rand_b
 
-    # Increment counter if random overflows (rollover)
-    assert counter_num_bits, "Counter is required as guard for random overflow"
+    timestamp_shift, random_num_bits, counter_mask, random_mask = _shifts(
+        unix_ts_ms_fraction_num_bits, counter_num_bits
+    )
 
     return (
-        _increment_counter(
-            counter_num_bits, counter_guard_seed_num_bits, counter_step,
-            last_counter
-        ),
-        random & ~(~0 << random_num_bits)  # Truncate the overflow random bits
+        data >> timestamp_shift,
+        (data >> random_num_bits) & counter_mask,
+        data & random_mask
     )
 
 
+try:
+    # Extract the values from two 64 bits words instead of from big ints
+    from _uuid7_fast import decompose as _decompose_data
+except ImportError:  # C extension is not built, use the pure Python version
+    _decompose_data = _py_decompose_data
+
+
 def _increment_counter(
-    counter_num_bits, counter_guard_seed_num_bits, counter_step, last_counter
+    counter_num_bits, counter_guard_seed_num_bits, counter_step, last_counter,
+    getrandbits
 ):
     # Calculate the counter
     if last_counter is None:
-        return _init_counter(counter_num_bits, counter_guard_seed_num_bits)
+        return _init_counter(
+            counter_num_bits, counter_guard_seed_num_bits, getrandbits
+        )
 
     counter = last_counter + counter_step
 
     # Check the counter doesn't overflow (rollover)
-    assert counter < (1 << counter_num_bits), "Counter overflow"
+    assert counter <= _MASK[counter_num_bits], "Counter overflow"
 
     return counter
 
 
-def _init_counter(counter_num_bits: int, counter_guard_seed_num_bits: int):
+def _init_counter(
+    counter_num_bits: int, counter_guard_seed_num_bits: int,
+    getrandbits: Callable[[int], int]
+):
     "Initialize the counter"
-    return _getrandbits(counter_num_bits - counter_guard_seed_num_bits)
+    return getrandbits(counter_num_bits - counter_guard_seed_num_bits)
+
+
+def _init_counter_and_random(
+    counter_num_bits: int, counter_guard_seed_num_bits: int,
+    random_num_bits: int, getrandbits: Callable[[int], int]
+):
+    "Initialize the counter and the random with a single random draw"
+    bits = getrandbits(
+        counter_num_bits - counter_guard_seed_num_bits + random_num_bits
+    )
+
+    return bits >> random_num_bits, bits & _MASK[random_num_bits]
 
 
-def _normalize_timestamp(timestamp: None | datetime | float | int | str) -> int:
+def _normalize_timestamp(timestamp: datetime | float | int | str) -> int:
     """Normalize the timestamp to milliseconds with 12 bits fraction
 
     The timestamp can be provided as:
-    - `None`: use the current time
     - `datetime`: a datetime object
     - `float`: seconds since the epoch
     - `int`: nanoseconds since the epoch
@@ -341,32 +553,148 @@ def _normalize_timestamp(timestamp: None | datetime | float | int | str) -> int:
     # NOTE: For speed and prevent float rounding errors, calcs are done
     #       using bit-wise and integer operations as 48+12 bits
 
-    if isinstance(timestamp, str):  # string in ISO 8601 format to datetime
-        timestamp = datetime.fromisoformat(timestamp)
-
-    if timestamp is None:
-        timestamp = time_ns()  # nanoseconds as `int` since epoch
-    elif isinstance(timestamp, datetime):
-        timestamp = timestamp.timestamp()  # seconds as `float` since epoch
-
+    # Numeric timestamps are checked first, since they don't need to be
+    # converted to a `datetime` object
     if isinstance(timestamp, int):  # nanoseconds as `int` since epoch
         result = (timestamp << 12) // NS_IN_MS
     elif isinstance(timestamp, float):  # seconds as `float` since epoch
-        result = floor(timestamp * 1000 * 2**12)
+        # `int()` truncates towards zero, that for valid (non-negative)
+        # timestamps is the same as `floor()`
+        result = int(timestamp * _S_TO_MS_12BITS)
     else:
-        raise TypeError("Invalid timestamp type")
+        if isinstance(timestamp, str):  # ISO 8601 format string to datetime
+            timestamp = datetime.fromisoformat(timestamp)
+
+        if not isinstance(timestamp, datetime):
+            raise TypeError("Invalid timestamp type")
 
-    assert 0 <= result < (1 << 60)  # Ensure it fits in 48+12 bits (truncate?)
+        # microseconds as `int` since epoch
+        if timestamp.tzinfo is None:  # Naive datetimes are in local time
+            timestamp = timestamp.astimezone()
+
+        result = ((timestamp - _EPOCH) // _MICROSECOND << 12) // 1000
+
+    if VALIDATE:  # Ensure it fits in 48+12 bits (truncate?)
+        assert 0 <= result < (1 << 60), "Timestamp out of range"
 
     return result
 
 
+def _normalize_timestamp_now(unix_ts_ms_fraction_num_bits: int) -> int:
+    """Return the current time in milliseconds with the given bits fraction
+
+    Conversion and truncation of the timestamp fraction are done in a single
+    integer division. Without fraction, the shift is by `0` bits, so it's
+    just the milliseconds.
+    """
+    return (time_ns() << unix_ts_ms_fraction_num_bits) // NS_IN_MS
+
+
+def _random_above(
+    start: int, random_num_bits: int, getrandbits: Callable[[int], int]
+) -> int:
+    "Return a random int of `random_num_bits` bits not lower than `start`"
+    # Draw only the offset over `start`, with rejection sampling so it's
+    # uniformly distributed. Each draw is accepted with more than 50%
+    # probability, so it usually needs a single one.
+    width = _MASK[random_num_bits] - start + 1
+    num_bits = (width - 1).bit_length()
+
+    offset = getrandbits(num_bits)
+    while offset >= width:
+        offset = getrandbits(num_bits)
+
+    return start + offset
+
+
+@lru_cache
+def _shifts(unix_ts_ms_fraction_num_bits: int, counter_num_bits: int):
+    """Return the shifts and masks of the given bits layout
+
+    Return the timestamp shift and the number of bits of the random inside
+    the 74 bits data, and the masks of the counter and random.
+    """
+    random_num_bits = 74 - unix_ts_ms_fraction_num_bits - counter_num_bits
+
+    return (
+        74 - unix_ts_ms_fraction_num_bits,
+        random_num_bits,
+        _MASK[counter_num_bits],
+        _MASK[random_num_bits]
+    )
+
+
+def _validate(
+    timestamp, unix_ts_ms_fraction_num_bits, counter,
+    counter_guard_seed_num_bits, counter_num_bits, counter_step,
+    counter_use_spec_recommended_num_bits, monotonic_random, random
+) -> int:
+    "Validate the input, and return the number of bits for the random"
+    assert 0 <= unix_ts_ms_fraction_num_bits <= 12, (
+        "Invalid number of bits for the timestamp fraction"
+    )
+
+    if monotonic_random:
+        if random is None:
+            assert (
+                0 <= counter_num_bits <= 74 - unix_ts_ms_fraction_num_bits
+            ), "Invalid number of bits for the counter (monotonic random guard)"
+
+            assert timestamp is None, (
+                "Random is required when timestamp is provided"
+            )
+
+    elif counter_num_bits:
+        if counter_use_spec_recommended_num_bits:
+            assert 12 <= counter_num_bits <= 42, (
+                "Invalid number of bits for the counter"
+            )
+        else:
+            assert (
+                0 < counter_num_bits <= 74 - unix_ts_ms_fraction_num_bits
+            ), "Invalid number of bits for the counter"
+
+    # Monotonic random with a provided random is not checked above, and the
+    # counter bits are needed to look up its mask
+    assert 0 <= counter_num_bits <= 74 - unix_ts_ms_fraction_num_bits, (
+        "Invalid number of bits for the counter"
+    )
+
+    if counter is None:
+        assert 0 <= counter_guard_seed_num_bits <= counter_num_bits, (
+            "Invalid number of bits for the counter guard seed"
+        )
+
+        if counter_num_bits:
+            assert timestamp is None, (
+                "Counter is required when timestamp is provided"
+            )
+
+            assert 0 < counter_step <= _MASK[counter_num_bits], (
+                "Invalid number of bits for the counter step"
+            )
+    else:
+        assert counter_num_bits, "counter_num_bits is required"
+        assert 0 <= counter <= _MASK[counter_num_bits], (
+            "Invalid number of bits for the counter"
+        )
+
+    random_num_bits = 74 - unix_ts_ms_fraction_num_bits - counter_num_bits
+
+    if random is not None:
+        assert 0 <= random <= _MASK[random_num_bits], (
+            "Invalid number of bits for the frozen random counter step"
+        )
+
+    return random_num_bits
+
+
 class UUIDv7(UUID):
     """
     UUIDv7 class for generating UUID version 7.
 
     Methods:
-        __init__(self, unix_ts_ms_fraction_num_bits=0, counter_num_bits=0, monotonic_random=False, *, timestamp=None, counter=None, counter_guard_seed_num_bits=0, counter_step=1, counter_use_spec_recommended_num_bits=True, random=None):
+        __init__(self, unix_ts_ms_fraction_num_bits=0, counter_num_bits=0, monotonic_random=False, *, timestamp=None, counter=None, counter_guard_seed_num_bits=0, counter_step=1, counter_use_spec_recommended_num_bits=True, random=None, cryptographic=None):
             Initialize the UUIDv7 class with various parameters for timestamp, counter, and random values.
 
     Attributes:
@@ -374,13 +702,23 @@ class UUIDv7(UUID):
         datetime (datetime): The datetime object representing the timestamp.
         random (int): The random value used in the UUID.
 
-        fields(self): The fields of the UUID.
+        fields (tuple): The `unix_ts_ms`, `rand_a` and `rand_b` fields.
+
+        unix_ts_ms (int): The Unix timestamp in milliseconds.
+        rand_a (int): The first part of the random value.
+        rand_b (int): The second part of the random value.
 
-        unix_ts_ms(self): The Unix timestamp in milliseconds.
-        rand_a(self): The first part of the random value.
-        rand_b(self): The second part of the random value.
+    `unix_ts_ms`, `rand_a` and `rand_b` are stored when the UUID is created,
+    while `counter`, `datetime` and `random` are decoded from them the first
+    time they are accessed and then cached.
     """
 
+    __slots__ = (
+        'unix_ts_ms', 'rand_a', 'rand_b',
+        '_unix_ts_ms_fraction_num_bits', '_counter_num_bits',
+        '_bytes', '_counter', '_datetime', '_random', '_str'
+    )
+
     def __init__(
         self,
 
@@ -401,10 +739,36 @@ class UUIDv7(UUID):
 
         # Random
         monotonic_random: bool = False,
-        random: None | int = None
+        random: None | int = None,
+        cryptographic: None | bool = None
     ):
         "Initialize the UUID7 class"
 
+        if hex is None and bytes is None and fields is None and int is None:
+            if not (
+                unix_ts_ms_fraction_num_bits or counter_guard_seed_num_bits or
+                counter_num_bits or monotonic_random
+            ) and timestamp is None and counter is None and random is None:
+                int, unix_ts_ms, random = _compose_default_uuid(
+                    _get_rng(cryptographic).getrandbits
+                )
+
+                self._init_generated(int, unix_ts_ms, 0, 0, 0, random)
+                return
+
+            int, unix_ts_ms_with_fraction, counter, random = _compose_uuid(
+                timestamp, unix_ts_ms_fraction_num_bits, counter,
+                counter_guard_seed_num_bits, counter_num_bits, counter_step,
+                counter_use_spec_recommended_num_bits, monotonic_random,
+                random, _get_rng(cryptographic).getrandbits
+            )
+
+            self._init_generated(
+                int, unix_ts_ms_with_fraction, unix_ts_ms_fraction_num_bits,
+                counter_num_bits, counter, random
+            )
+            return
+
         if fields is not None:
             if len(fields) != 3:
                 raise ValueError('fields is not a 3-tuple')
@@ -420,63 +784,449 @@ class UUIDv7(UUID):
 
             int = _construct_uuid7_int(unix_ts_ms, rand_a, rand_b)
 
-        elif hex is None and bytes is None and int is None:
-            int = _compose_uuid(
-                timestamp, unix_ts_ms_fraction_num_bits, counter,
-                counter_guard_seed_num_bits, counter_num_bits, counter_step,
-                counter_use_spec_recommended_num_bits, monotonic_random, random
-            )
+            # Fields are already validated and the version and variant bits
+            # are stamped on, so there's no need to go through the `UUID`
+            # constructor checks
+            if hex is None and bytes is None:
+                object.__setattr__(self, 'int', int)
+                object.__setattr__(self, 'is_safe', _SAFE_UUID_UNKNOWN)
+
+                self._expose_values(
+                    unix_ts_ms, rand_a, rand_b, unix_ts_ms_fraction_num_bits,
+                    counter_num_bits
+                )
+                return
 
-        # Generate the UUID
         super().__init__(hex, bytes, int=int)
 
         assert self.version == 7
 
-        # Expose the values
-        int = (
-            self.unix_ts_ms << 74 |
-            self.rand_a << 62 |
-            self.rand_b
+        int = self.int
+
+        self._expose_values(
+            int >> 80, int >> 64 & 0x0fff, int & _MASK62,
+            unix_ts_ms_fraction_num_bits, counter_num_bits
         )
 
-        timestamp = (
-            (int >> (74 - unix_ts_ms_fraction_num_bits)) /
-            (1000 * 2**unix_ts_ms_fraction_num_bits)
+    def __getstate__(self):
+        state = super().__getstate__()
+
+        # Keep the bits layout, so the counter and random can be extracted
+        if self._unix_ts_ms_fraction_num_bits:
+            state['unix_ts_ms_fraction_num_bits'] = (
+                self._unix_ts_ms_fraction_num_bits
+            )
+        if self._counter_num_bits:
+            state['counter_num_bits'] = self._counter_num_bits
+
+        return state
+
+    def __setstate__(self, state):
+        state = dict(state)
+
+        unix_ts_ms_fraction_num_bits = state.pop(
+            'unix_ts_ms_fraction_num_bits', 0
         )
-        dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+        counter_num_bits = state.pop('counter_num_bits', 0)
 
-        random_num_bits = 74 - unix_ts_ms_fraction_num_bits - counter_num_bits
+        super().__setstate__(state)
+
+        int = self.int
 
-        counter = (int >> random_num_bits) & ~(~0 << counter_num_bits)
-        random = int & ~(~0 << random_num_bits)
+        self._expose_values(
+            int >> 80, int >> 64 & 0x0fff, int & _MASK62,
+            unix_ts_ms_fraction_num_bits, counter_num_bits
+        )
 
+    def __str__(self):
+        # UUIDs are often converted to strings several times (logging,
+        # serialization...), so format them only once
+        try:
+            return self._str
+        except AttributeError:
+            result = super().__str__()
+            object.__setattr__(self, '_str', result)
+            return result
+
+    def _expose_values(
+        self, unix_ts_ms, rand_a, rand_b, unix_ts_ms_fraction_num_bits,
+        counter_num_bits
+    ):
+        "Expose the fields, and the bits layout to lazily decode the others"
         # HACK: We need to set the attributes directly since the UUID
         #       class doesn't allow to set them
-        object.__setattr__(self, 'datetime', dt)
-        object.__setattr__(self, 'counter', counter)
-        object.__setattr__(self, 'random', random)
+        object.__setattr__(self, 'unix_ts_ms', unix_ts_ms)
+        object.__setattr__(self, 'rand_a', rand_a)
+        object.__setattr__(self, 'rand_b', rand_b)
+        object.__setattr__(
+            self, '_unix_ts_ms_fraction_num_bits', unix_ts_ms_fraction_num_bits
+        )
+        object.__setattr__(self, '_counter_num_bits', counter_num_bits)
 
-    @cached_property
-    def fields(self):
-        return (self.unix_ts_ms, self.rand_a, self.rand_b)
+    def _init_generated(
+        self, int, unix_ts_ms_with_fraction, unix_ts_ms_fraction_num_bits,
+        counter_num_bits, counter, random
+    ):
+        "Initialize the UUID from its generated int and composing values"
+        # The generated UUID is valid by construction, so there's no need to
+        # go through the `UUID` constructor checks
+        object.__setattr__(self, 'int', int)
+        object.__setattr__(self, 'is_safe', _SAFE_UUID_UNKNOWN)
+
+        self._expose_values(
+            unix_ts_ms_with_fraction >> unix_ts_ms_fraction_num_bits,
+            int >> 64 & 0x0fff, int & _MASK62, unix_ts_ms_fraction_num_bits,
+            counter_num_bits
+        )
 
-    @cached_property
-    def unix_ts_ms(self):
-        return self.int >> 80
+        # The counter and random values are already known, so there's no
+        # need to extract them back from the UUID
+        object.__setattr__(self, '_counter', counter)
+        object.__setattr__(self, '_random', random)
 
-    @cached_property
-    def rand_a(self):
-        return self.int >> 64 & 0x0fff
+    def _decompose(self):
+        "Decompose the fields into the timestamp, counters and random data"
+        return _decompose_data(
+            self.unix_ts_ms, self.rand_a, self.rand_b,
+            self._unix_ts_ms_fraction_num_bits, self._counter_num_bits
+        )
 
-    @cached_property
-    def rand_b(self):
-        return self.int & ~(~0 << 62)
+    @property
+    def bytes(self):
+        try:
+            return self._bytes
+        except AttributeError:
+            result = self.int.to_bytes(16, 'big')
+            object.__setattr__(self, '_bytes', result)
+            return result
+
+    @property
+    def fields(self):
+        return (self.unix_ts_ms, self.rand_a, self.rand_b)
+
+    # Values that are not needed to generate the UUID are computed only when
+    # accessed, since most UUIDs are never inspected. They are cached by hand
+    # in private slots, since `cached_property` needs an instance `__dict__`.
+
+    @property
+    def counter(self):
+        try:
+            return self._counter
+        except AttributeError:
+            result = self._decompose()[1]
+            object.__setattr__(self, '_counter', result)
+            return result
+
+    @property
+    def datetime(self):
+        try:
+            return self._datetime
+        except AttributeError:
+            # Only the timestamp is needed, so don't decompose the counter
+            # and random too. Its fraction is in the top bits of `rand_a`.
+            unix_ts_ms_fraction_num_bits = self._unix_ts_ms_fraction_num_bits
+
+            if unix_ts_ms_fraction_num_bits:
+                timestamp = (
+                    (
+                        self.unix_ts_ms << unix_ts_ms_fraction_num_bits |
+                        self.rand_a >> (12 - unix_ts_ms_fraction_num_bits)
+                    ) /
+                    _FRAC_DIVISOR[unix_ts_ms_fraction_num_bits]
+                )
+            else:
+                timestamp = self.unix_ts_ms / 1000.0
+
+            result = datetime.fromtimestamp(timestamp, tz=_UTC)
+            object.__setattr__(self, '_datetime', result)
+            return result
+
+    @property
+    def random(self):
+        try:
+            return self._random
+        except AttributeError:
+            result = self._decompose()[2]
+            object.__setattr__(self, '_random', result)
+            return result
 
 
 uuid7 = UUIDv7
 uuid7.__doc__ = UUIDv7.__doc__
 
 
+@lru_cache
+def make_uuid7_generator(
+    *,  # Keyword-only arguments
+
+    # Timestamp
+    unix_ts_ms_fraction_num_bits: int = 0,
+
+    # Counter
+    counter_guard_seed_num_bits: int = 0,
+    counter_num_bits: int = 0,
+    counter_step: int = 1,
+    counter_use_spec_recommended_num_bits: bool = True,
+
+    # Random
+    monotonic_random: bool = False,
+    cryptographic: None | bool = None
+):
+    """Make a function generating UUIDv7 with the given parameters
+
+    Parameters are validated only once, here, and the values derived from
+    them are computed ahead, so the returned function can generate new
+    UUIDs for the current time without checking them on each call.
+    Generators are cached, so the same parameters return the same function.
+    """
+    random_num_bits = _validate(
+        None, unix_ts_ms_fraction_num_bits, None,
+        counter_guard_seed_num_bits, counter_num_bits, counter_step,
+        counter_use_spec_recommended_num_bits, monotonic_random, None
+    )
+
+    stateless = not (counter_num_bits or monotonic_random)
+
+    def generate() -> UUIDv7:
+        "Generate a new UUIDv7 for the current time"
+        # Same as `_normalize_timestamp_now()`, inlined to save the call
+        unix_ts_ms_with_fraction = (
+            (time_ns() << unix_ts_ms_fraction_num_bits) // NS_IN_MS
+        )
+
+        if stateless:
+            counter = 0
+            random = _get_rng(cryptographic).getrandbits(random_num_bits)
+
+        else:
+            counter, random = _calc_counter_and_random(
+                unix_ts_ms_fraction_num_bits, counter_num_bits,
+                monotonic_random, None, counter_guard_seed_num_bits,
+                counter_step, None, unix_ts_ms_with_fraction,
+                random_num_bits, _get_rng(cryptographic).getrandbits
+            )
+
+        int = _compose_data(
+            unix_ts_ms_with_fraction, unix_ts_ms_fraction_num_bits,
+            counter, random_num_bits, random
+        )
+
+        uuid = UUIDv7.__new__(UUIDv7)
+        uuid._init_generated(
+            int, unix_ts_ms_with_fraction, unix_ts_ms_fraction_num_bits,
+            counter_num_bits, counter, random
+        )
+
+        return uuid
+
+    return generate
+
+
+def uuid7_fast(cryptographic: None | bool = None) -> UUIDv7:
+    """Generate a new UUIDv7 for the current time with the default parameters
+
+    Same as `uuid7()`, but skipping the parameters check to generate them
+    as fast as possible.
+    """
+    int, unix_ts_ms, random = _compose_default_uuid(
+        _get_rng(cryptographic).getrandbits
+    )
+
+    uuid = UUIDv7.__new__(UUIDv7)
+    uuid._init_generated(int, unix_ts_ms, 0, 0, 0, random)
+
+    return uuid
+
+
+def uuid7_many(n: int, **kwargs) -> list[UUIDv7]:
+    """Generate `n` UUIDv7 with the same parameters
+
+    Parameters are the same of `make_uuid7_generator()`. When there's no
+    counter nor monotonic random, the current time is read once and all the
+    random bits are drawn in a single block for the whole batch, so the
+    per-UUID cost is just composing it. Otherwise, UUIDs are generated one
+    by one to keep track of the counters.
+    """
+    generate = make_uuid7_generator(**kwargs)  # Validate the parameters
+
+    if kwargs.get('counter_num_bits') or kwargs.get('monotonic_random'):
+        return [generate() for _ in range(n)]
+
+    unix_ts_ms_fraction_num_bits = kwargs.get(
+        'unix_ts_ms_fraction_num_bits', 0
+    )
+
+    random_num_bits = 74 - unix_ts_ms_fraction_num_bits
+    random_num_bytes = (random_num_bits + 7) // 8
+    random_shift = random_num_bytes * 8 - random_num_bits
+
+    unix_ts_ms_with_fraction = _normalize_timestamp_now(
+        unix_ts_ms_fraction_num_bits
+    )
+
+    size = n * random_num_bytes
+
+    cryptographic = kwargs.get('cryptographic')
+    if cryptographic is None:
+        cryptographic = CRYPTOGRAPHIC_RANDOM
+
+    buffer = memoryview(
+        urandom(size) if cryptographic else _get_fast_rng().randbytes(size)
+    )
+
+    result = []
+
+    for pos in range(0, size, random_num_bytes):
+        random = (
+            int.from_bytes(buffer[pos:pos + random_num_bytes], 'big') >>
+            random_shift
+        )
+
+        uuid = UUIDv7.__new__(UUIDv7)
+        uuid._init_generated(
+            _compose_data(
+                unix_ts_ms_with_fraction, unix_ts_ms_fraction_num_bits, 0,
+                random_num_bits, random
+            ),
+            unix_ts_ms_with_fraction, unix_ts_ms_fraction_num_bits, 0, 0,
+            random
+        )
+
+        result.append(uuid)
+
+    return result
+
+
+def uuid7_array(
+    n: int,
+    *,  # Keyword-only arguments
+    unix_ts_ms_fraction_num_bits: int = 0,
+    counter_guard_seed_num_bits: int = 0,
+    counter_num_bits: int = 0,
+    counter_use_spec_recommended_num_bits: bool = True,
+    cryptographic: None | bool = None
+):
+    """Generate `n` UUIDv7 as a pair of NumPy `uint64` arrays
+
+    Returns the high and low 64 bits words of the UUIDs as two separate
+    arrays, composed at C speed without creating any Python objects, for
+    very large batches or downstream numeric uses. Timestamp is read only
+    once for the whole batch. With `counter_num_bits`, UUIDs of the batch
+    get consecutive counters, so they are sorted. Their range is reserved
+    from the counters of the current thread, so it continues the counters
+    of the previous UUIDs of the same milliseconds, or it's carefully seeded
+    like `uuid7()` does. Random words are drawn from `os.urandom()`, or from
+    NumPy default generator if not `cryptographic` (by default,
+    `CRYPTOGRAPHIC_RANDOM`). Requires NumPy, an optional dependency that
+    can be installed with the `numpy` extra (`pip install uuid7[numpy]`).
+    """
+    import numpy as np
+
+    if cryptographic is None:
+        cryptographic = CRYPTOGRAPHIC_RANDOM
+
+    # `unix_ts_ms`, version and timestamp fraction bits are the same for all
+    # the UUIDs in the batch, so only the counter and random bits need to be
+    # vectorized
+    if VALIDATE:
+        random_num_bits = _validate(
+            None, unix_ts_ms_fraction_num_bits, None,
+            counter_guard_seed_num_bits, counter_num_bits, 1,
+            counter_use_spec_recommended_num_bits, False, None
+        )
+    else:
+        random_num_bits = 74 - unix_ts_ms_fraction_num_bits - counter_num_bits
+
+    unix_ts_ms_with_fraction = _normalize_timestamp_now(
+        unix_ts_ms_fraction_num_bits
+    )
+
+    hi_bits = np.uint64(
+        unix_ts_ms_with_fraction >> unix_ts_ms_fraction_num_bits << 16 |
+        0x7000 |
+        (unix_ts_ms_with_fraction & _MASK[unix_ts_ms_fraction_num_bits])
+        << (12 - unix_ts_ms_fraction_num_bits)
+    )
+
+    words = np.frombuffer(
+        urandom(n * 16)
+        if cryptographic else
+        np.random.default_rng().bytes(n * 16),
+        np.uint64
+    )
+
+    # Random bits of the `rand_a` and `rand_b` fields
+    hi = (
+        words[0::2] & np.uint64(_MASK[max(random_num_bits - 62, 0)]) |
+        hi_bits
+    )
+    lo = (
+        words[1::2] & np.uint64(_MASK[min(random_num_bits, 62)]) |
+        np.uint64(_VARIANT_BITS)
+    )
+
+    if counter_num_bits and n:
+        # Reserve the counters range of the batch, continuing the last
+        # counter of the same timestamp, or seeding it if it has changed
+        entry = _get_counters().setdefault(
+            (unix_ts_ms_fraction_num_bits, counter_num_bits), [0, None, None]
+        )
+
+        last_timestamp, last_counter, _ = entry
+
+        assert last_timestamp <= unix_ts_ms_with_fraction, (
+            "Timestamps are not monotonic"
+        )
+
+        if (
+            last_timestamp == unix_ts_ms_with_fraction and
+            last_counter is not None
+        ):
+            counter = last_counter + 1
+        else:
+            counter = _init_counter(
+                counter_num_bits, counter_guard_seed_num_bits,
+                _get_rng(cryptographic).getrandbits
+            )
+
+        last_counter = counter + n - 1
+
+        # Check the counter doesn't overflow (rollover)
+        assert last_counter <= _MASK[counter_num_bits], "Counter overflow"
+
+        # Counter can span over both `rand_a` and `rand_b` fields. Counters
+        # can be wider than 64 bits, so split them at the `rand_b` boundary
+        # and carry the overflow of the low part to the high one.
+        counters = np.arange(n, dtype=np.uint64)
+
+        if random_num_bits >= 62:
+            hi |= (
+                (counters + np.uint64(counter)) <<
+                np.uint64(random_num_bits - 62)
+            )
+        else:
+            num_bits = 62 - random_num_bits
+
+            counters += np.uint64(counter & _MASK[num_bits])
+
+            hi |= (
+                (counters >> np.uint64(num_bits)) +
+                np.uint64(counter >> num_bits)
+            )
+            lo |= (
+                (counters & np.uint64(_MASK[num_bits])) <<
+                np.uint64(random_num_bits)
+            )
+
+        entry[0] = unix_ts_ms_with_fraction
+        entry[1] = last_counter
+        entry[2] = (
+            (int(hi[-1]) & 0x0fff) << 62 | int(lo[-1]) & _MASK62
+        ) & _MASK[random_num_bits]
+
+    return hi, lo
+
+
 if __name__ == '__main__':
     from argparse import ArgumentParser
 
@@ -517,6 +1267,10 @@ if __name__ == '__main__':
         '-r', '--random', type=int,
         help="Random value (default: None)"
     )
+    parser.add_argument(
+        '--non-cryptographic', action='store_true',
+        help="Use a faster non-cryptographic random generator (default: False)"
+    )
 
     args = parser.parse_args()
 
@@ -532,6 +1286,7 @@ if __name__ == '__main__':
             counter_use_spec_recommended_num_bits=(
                 args.counter_use_spec_recommended_num_bits
             ),
-            random=args.random
+            random=args.random,
+            cryptographic=not args.non_cryptographic
         )
     )